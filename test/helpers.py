@@ -0,0 +1,50 @@
+# Shared stimulus helpers for the counter tests. The clock is generated in
+# tb.v, so none of these start a cocotb Clock.
+
+from cocotb.handle import Immediate
+from cocotb.triggers import FallingEdge, RisingEdge
+
+# uio_in control bits are driven through the one-bit en/load/up/oe regs in
+# tb.v, which pack them as [0]=EN, [1]=LOAD, [2]=UP, [3]=OE (matches
+# RTL). ctrl() gives a full setting for drive(dut, **ctrl(...)).
+def ctrl(en=0, load=0, up=1, oe=0):
+    return dict(en=en, load=load, up=up, oe=oe)
+
+# Control settings the tests drive, built once rather than on every write
+CTRL_COUNT_UP       = ctrl(en=1, up=1, oe=1)
+CTRL_COUNT_DN       = ctrl(en=1, up=0, oe=1)
+CTRL_TRISTATE_COUNT = ctrl(en=1, up=1, oe=0)
+
+def drive(dut, **signals):
+    # Write several inputs together, e.g. drive(dut, ui_in=0x55, load=1),
+    # so they all land in the same simulator step
+    for name, value in signals.items():
+        getattr(dut, name).value = Immediate(value)
+
+async def clock_edge(dut):
+    # Step past the next rising edge to the following falling edge, so the
+    # registers updated on it are visible and any writes that follow land half
+    # a period before the next rising edge.
+    await RisingEdge(dut.clk)
+    await FallingEdge(dut.clk)
+
+async def reset_dut(dut):
+    drive(dut, ena=1, ui_in=0, en=0, load=0, up=0, oe=0, rst_n=0)
+    # rst_n is asynchronous, so no clock edge is needed to apply it. Release it
+    # at the first falling edge, clear of any rising edge, which also leaves
+    # the caller at the same point in the cycle as clock_edge() does.
+    await FallingEdge(dut.clk)
+    dut.rst_n.value = Immediate(1)
+
+async def sync_load(dut, value, oe=1):
+    # Synchronous load occurs on the next rising edge with LOAD=1
+    drive(dut, ui_in=value, **ctrl(en=0, load=1, up=1, oe=oe))
+    await clock_edge(dut)
+    # LOAD is a one-cycle pulse. The loaded value (and loaded_pulse) is already
+    # visible here; dropping LOAD now is enough to stop the next edge reloading.
+    dut.load.value = Immediate(0)
+
+async def check_count(dut, expected, msg):
+    # Advance one clock and check the count presented on the uio bus
+    await clock_edge(dut)
+    assert int(dut.uio_out.value) == expected, msg
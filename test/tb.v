@@ -1,24 +1,46 @@
 `default_nettype none
-`timescale 1ns / 1ps
+`timescale 1ns / 1ns
 
 /* This testbench just instantiates the module and makes some convenient wires
-   that can be driven / tested by the cocotb test.py.
+   that can be driven / tested by the cocotb tests. The clock is generated here
+   in the HDL so the simulator toggles it natively instead of cocotb driving
+   every edge from Python.
 */
 module tb ();
 
-  // Dump the signals to a VCD file. You can view it with gtkwave or surfer.
+  // Dump the signals to a VCD file when built with WAVES=1 (except on Icarus,
+  // where cocotb dumps an FST file itself). You can view it with gtkwave or
+  // surfer.
+`ifdef WAVES
   initial begin
     $dumpfile("tb.vcd");
     $dumpvars(0, tb);
     #1;
   end
+`endif
+
+  // Free-running clock. For RTL each half period is a single 1 ns tick (2 ns
+  // period); the gate-level run keeps a 10 ns period so the unit-delay cells
+  // settle well within a cycle.
+`ifdef GL_TEST
+  localparam HALF_PERIOD = 5;
+`else
+  localparam HALF_PERIOD = 1;
+`endif
+  reg clk = 1'b0;
+  always #HALF_PERIOD clk = ~clk;
 
   // Wire up the inputs and outputs:
-  reg clk;
   reg rst_n;
   reg ena;
   reg [7:0] ui_in;
-  reg [7:0] uio_in;
+  // Control bits as separate regs so tests can change one without rewriting
+  // the whole bus. Packed onto uio_in as [0]=EN, [1]=LOAD, [2]=UP, [3]=OE:
+  reg en;
+  reg load;
+  reg up;
+  reg oe;
+  wire [7:0] uio_in = {4'b0000, oe, up, load, en};
   wire [7:0] uo_out;
   wire [7:0] uio_out;
   wire [7:0] uio_oe;
@@ -28,7 +50,6 @@ module tb ();
   wire VGND = 1'b0;
 `endif
 
-
   // Replace tt_um_example with your module name:
   tt_um_tyt33 user_project (
 
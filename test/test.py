@@ -2,39 +2,32 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import cocotb
-from cocotb.clock import Clock
-from cocotb.triggers import ClockCycles
+
+from helpers import reset_dut, sync_load
 
 
 @cocotb.test()
 async def test_project(dut):
     dut._log.info("Start")
 
-    # Set the clock period to 10 us (100 KHz)
-    clock = Clock(dut.clk, 10, unit="us")
-    cocotb.start_soon(clock.start())
+    # The clock is generated in tb.v, so no cocotb Clock is started here
 
     # Reset
     dut._log.info("Reset")
-    dut.ena.value = 1
-    dut.ui_in.value = 0
-    dut.uio_in.value = 0
-    dut.rst_n.value = 0
-    await ClockCycles(dut.clk, 10)
-    dut.rst_n.value = 1
+    await reset_dut(dut)
 
     dut._log.info("Test project behavior")
 
-    # Set the input values you want to test
-    dut.ui_in.value = 20
-    dut.uio_in.value = 30
-
-    # Wait for one clock cycle to see the output values
-    await ClockCycles(dut.clk, 1)
+    # Set the input values you want to test. uio_in is packed in tb.v from the
+    # en/load/up/oe regs, so drive those (see helpers.drive) rather than uio_in.
+    # Here 20 is loaded from ui_in with outputs enabled, which also takes one
+    # clock cycle to show up on the outputs.
+    await sync_load(dut, 20, oe=1)
 
     # The following assersion is just an example of how to check the output values.
     # Change it to match the actual expected output of your module:
-    assert dut.uo_out.value == 50
+    # uo_out = {wrap_pulse, carry_borrow, loaded_pulse, count[4:0]}
+    assert dut.uo_out.value == 0x20 | 20
 
     # Keep testing the module by changing the input values, waiting for
     # one or more clock cycles, and asserting the expected output values.